@@ -1,197 +1,330 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import logging
+import queue
+import selectors
 import socket
+import sys
 import threading
+from logging.handlers import QueueHandler, QueueListener
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트 하나가 서버 메모리를 무한히 쓰지 못하도록 버퍼 크기를 제한한다.
+MAX_LINE_BYTES = 64 * 1024        # 줄바꿈 없이 쌓을 수 있는 입력
+MAX_PENDING_BYTES = 256 * 1024    # 상대가 읽지 않아 밀린 출력
+
+
+class ClientState:
+    """접속자 한 명의 소켓, 닉네임, 입출력 버퍼."""
+
+    def __init__(self, sock: socket.socket, addr) -> None:
+        self.sock = sock
+        self.addr = addr
+        self.nickname: str | None = None  # 핸드셰이크 전에는 None
+        self.recv_buf = bytearray()       # 아직 줄바꿈을 못 만난 입력
+        self.send_buf = bytearray()       # 아직 못 보낸 출력
+        self.closing = False              # 남은 출력만 보내고 닫을 예정
 
 
 class ChatServer:
-    """간단한 멀티스레드 채팅 서버."""
+    """selectors 기반 단일 스레드 채팅 서버."""
 
     def __init__(self, host: str = '0.0.0.0', port: int = 5000) -> None:
         self.host = host
         self.port = port
         self.server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        # accept()가 영원히 막히지 않도록 타임아웃
-        self.server_sock.settimeout(1.0)
+        self.server_sock.setblocking(False)
+
+        # epoll(Linux) / kqueue(BSD, macOS) 등 플랫폼 최선의 구현을 고른다.
+        self.selector = selectors.DefaultSelector()
 
-        # 접속자 관리
-        self.clients = {}   # {sock: nickname}
-        self.nick_map = {}  # {nickname: sock}
-        self.lock = threading.Lock()
+        # 접속자 관리 (모두 이벤트 루프 스레드에서만 접근하므로 락이 필요 없다)
+        self.clients = {}   # {sock: ClientState}
+        self.nick_map = {}  # {nickname: ClientState}
+        self._nick_counter = {}  # {base: 다음에 시도할 숫자 접미사}
 
-        # 종료 플래그
+        # 종료 플래그 (관리 콘솔 스레드가 세운다)
         self.stop_event = threading.Event()
 
     def start(self) -> None:
         self.server_sock.bind((self.host, self.port))
         self.server_sock.listen()
-        print(f'[*] 서버 시작: {self.host}:{self.port}')
+        # data=None 은 리스닝 소켓 표시
+        self.selector.register(self.server_sock, selectors.EVENT_READ, data=None)
+        logger.info('[*] 서버 시작: %s:%s', self.host, self.port)
 
         try:
             while not self.stop_event.is_set():
-                try:
-                    client_sock, addr = self.server_sock.accept()
-                except socket.timeout:
-                    # 주기적으로 깨어나 종료 플래그 확인
-                    continue
-
-                threading.Thread(
-                    target=self._handle_client,
-                    args=(client_sock, addr),
-                    daemon=True,
-                ).start()
+                # 1초마다 깨어나 종료 플래그 확인
+                for key, mask in self.selector.select(timeout=1.0):
+                    if key.data is None:
+                        self._on_accept()
+                        continue
+
+                    state = key.data
+                    if mask & selectors.EVENT_READ:
+                        self._on_readable(state)
+                    if mask & selectors.EVENT_WRITE and state.sock in self.clients:
+                        self._on_writable(state)
         except KeyboardInterrupt:
-            print('\n[*] Ctrl+C 감지: 서버 종료 중...')
+            logger.info('[*] Ctrl+C 감지: 서버 종료 중...')
         finally:
             self._shutdown()
 
-    def _handle_client(self, client_sock: socket.socket, addr) -> None:
-        try:
-            nickname = self._handshake_for_nickname(client_sock)
-            if nickname is None:
-                client_sock.close()
+    # ---- 이벤트 핸들러 ----
+    def _on_accept(self) -> None:
+        while True:
+            try:
+                client_sock, addr = self.server_sock.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
                 return
 
-            self._register_client(client_sock, nickname)
-            self._broadcast(f'[{nickname}]님이 입장하셨습니다.')
-
-            self._send_line(client_sock, '안내: 일반 메시지는 모두에게 전송됩니다.')
-            self._send_line(client_sock, '안내: 종료는 /종료, 귓속말은 /w 대상닉 메시지')
-
-            while True:
-                data = client_sock.recv(1024)
-                if not data:
-                    break
+            client_sock.setblocking(False)
+            state = ClientState(client_sock, addr)
+            self.clients[client_sock] = state
+            self.selector.register(client_sock, selectors.EVENT_READ, data=state)
+            self._send_line(state, '닉네임을 입력해주세요:')
 
-                msg = data.decode('utf-8', errors='ignore').strip()
-                if not msg:
-                    continue
+    def _on_readable(self, state: ClientState) -> None:
+        try:
+            data = state.sock.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._remove_client(state)
+            return
 
-                if msg == '/종료':
-                    self._send_line(client_sock, '연결을 종료합니다.')
-                    break
+        if not data:
+            self._remove_client(state)
+            return
+        if state.closing:
+            return
 
-                if msg.startswith('/w '):
-                    self._handle_whisper(client_sock, msg)
-                    continue
+        buf = state.recv_buf
+        buf += data
+        while True:
+            idx = buf.find(b'\n')
+            if idx < 0:
+                break
+            raw = bytes(buf[:idx])
+            del buf[:idx + 1]
+
+            msg = raw.decode('utf-8', errors='ignore').strip()
+            if state.nickname is None:
+                self._handshake_for_nickname(state, msg)
+            else:
+                self._handle_message(state, msg)
+
+            if state.closing or state.sock not in self.clients:
+                return
 
-                sender = self._get_nickname(client_sock)
-                if sender is None:
-                    break
-                self._broadcast(f'{sender}> {msg}')
-        except ConnectionResetError:
-            pass
-        finally:
-            self._remove_client(client_sock)
+        # 줄바꿈 없이 계속 보내기만 하는 클라이언트는 끊는다.
+        if len(buf) > MAX_LINE_BYTES:
+            self._remove_client(state)
 
-    def _handshake_for_nickname(self, client_sock: socket.socket) -> str | None:
-        self._send_line(client_sock, '닉네임을 입력해주세요:')
+    def _on_writable(self, state: ClientState) -> None:
+        buf = state.send_buf
         try:
-            data = client_sock.recv(1024)
-        except ConnectionResetError:
-            return None
+            sent = state.sock.send(memoryview(buf))
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            self._remove_client(state)
+            return
 
-        if not data:
-            return None
+        # 일부만 보내졌으면 나머지는 다음 EVENT_WRITE 때 이어서 보낸다.
+        del buf[:sent]
+        if buf:
+            return
+        if state.closing:
+            self._remove_client(state)
+            return
+        self.selector.modify(state.sock, selectors.EVENT_READ, data=state)
 
-        raw = data.decode('utf-8', errors='ignore').strip()
+    # ---- 프로토콜 ----
+    def _handshake_for_nickname(self, state: ClientState, raw: str) -> None:
         if not raw:
             raw = 'user'
 
         nickname = self._make_unique_nickname(raw)
-        self._send_line(client_sock, f'닉네임이 [{nickname}]로 설정되었습니다.')
-        return nickname
+        self._send_line(state, f'닉네임이 [{nickname}]로 설정되었습니다.')
+
+        self._register_client(state, nickname)
+        self._broadcast(f'[{nickname}]님이 입장하셨습니다.')
+
+        self._send_line(state, '안내: 일반 메시지는 모두에게 전송됩니다.')
+        self._send_line(state, '안내: 종료는 /종료, 귓속말은 /w 대상닉 메시지')
+
+    def _handle_message(self, state: ClientState, msg: str) -> None:
+        if not msg:
+            return
+
+        if msg == '/종료':
+            self._send_line(state, '연결을 종료합니다.')
+            self._close_after_flush(state)
+            return
+
+        if msg.startswith('/w '):
+            self._handle_whisper(state, msg)
+            return
+
+        self._broadcast(f'{state.nickname}> {msg}')
 
     def _make_unique_nickname(self, base: str) -> str:
-        with self.lock:
-            if base not in self.nick_map:
-                return base
-            i = 2
-            while True:
-                cand = f'{base}{i}'
-                if cand not in self.nick_map:
-                    return cand
-                i += 1
-
-    def _register_client(self, client_sock: socket.socket, nickname: str) -> None:
-        with self.lock:
-            self.clients[client_sock] = nickname
-            self.nick_map[nickname] = client_sock
-        print(f'[*] 접속: {nickname}')
-
-    def _remove_client(self, client_sock: socket.socket) -> None:
-        with self.lock:
-            nickname = self.clients.pop(client_sock, None)
-            if nickname:
-                self.nick_map.pop(nickname, None)
-        if nickname:
-            print(f'[*] 종료: {nickname}')
-            self._broadcast(f'[{nickname}]님이 퇴장하셨습니다.')
+        if base not in self.nick_map:
+            return base
+        # 매번 2부터 다시 세지 않도록 base별 마지막 접미사를 기억해 이어서 시도
+        i = self._nick_counter.get(base, 2)
+        while True:
+            cand = f'{base}{i}'
+            i += 1
+            if cand not in self.nick_map:
+                self._nick_counter[base] = i
+                return cand
+
+    def _register_client(self, state: ClientState, nickname: str) -> None:
+        state.nickname = nickname
+        self.nick_map[nickname] = state
+        logger.info('[*] 접속: %s', nickname)
+
+    def _remove_client(self, state: ClientState) -> None:
+        if self.clients.pop(state.sock, None) is None:
+            return
+        try:
+            self.selector.unregister(state.sock)
+        except (KeyError, ValueError):
+            pass
         try:
-            client_sock.close()
+            state.sock.close()
         except OSError:
             pass
 
+        nickname = state.nickname
+        if nickname and self.nick_map.get(nickname) is state:
+            del self.nick_map[nickname]
+            logger.info('[*] 종료: %s', nickname)
+            self._broadcast(f'[{nickname}]님이 퇴장하셨습니다.')
+
+    def _close_after_flush(self, state: ClientState) -> None:
+        """남은 출력을 모두 보낸 뒤 연결을 닫는다."""
+        state.closing = True
+        if not state.send_buf:
+            self._remove_client(state)
+
     def _broadcast(self, line: str) -> None:
-        with self.lock:
-            targets = list(self.clients.keys())
-        for sock in targets:
-            self._send_line(sock, line)
+        # 인코딩은 한 번만 하고 같은 bytes를 모든 수신자 버퍼에 붙인다.
+        data = (line + '\n').encode('utf-8')
+        # 전송 중 밀린 클라이언트가 끊기면 nick_map이 바뀌므로 복사본을 돈다.
+        for state in list(self.nick_map.values()):
+            self._enqueue(state, data)
 
-    def _handle_whisper(self, sender_sock: socket.socket, raw_cmd: str) -> None:
+    def _handle_whisper(self, sender: ClientState, raw_cmd: str) -> None:
         parts = raw_cmd.split(' ', 2)
         if len(parts) < 3:
-            self._send_line(sender_sock, '형식: /w 대상닉 메시지')
+            self._send_line(sender, '형식: /w 대상닉 메시지')
             return
 
         _, target_nick, message = parts
         if not target_nick or not message:
-            self._send_line(sender_sock, '형식: /w 대상닉 메시지')
+            self._send_line(sender, '형식: /w 대상닉 메시지')
             return
 
-        with self.lock:
-            target_sock = self.nick_map.get(target_nick)
+        target = self.nick_map.get(target_nick)
+        sender_nick = sender.nickname or '알수없음'
 
-        sender_nick = self._get_nickname(sender_sock) or '알수없음'
-
-        if target_sock is None:
-            self._send_line(sender_sock, f'대상 [{target_nick}]을(를) 찾을 수 없습니다.')
+        if target is None:
+            self._send_line(sender, f'대상 [{target_nick}]을(를) 찾을 수 없습니다.')
             return
 
-        self._send_line(target_sock, f'(귓속말) {sender_nick}> {message}')
-        self._send_line(sender_sock, f'(귓속말 전송) {sender_nick} -> {target_nick}: {message}')
+        self._send_line(target, f'(귓속말) {sender_nick}> {message}')
+        self._send_line(sender, f'(귓속말 전송) {sender_nick} -> {target_nick}: {message}')
 
-    def _get_nickname(self, client_sock: socket.socket) -> str | None:
-        with self.lock:
-            return self.clients.get(client_sock)
+    def _send_line(self, state: ClientState, line: str) -> None:
+        self._enqueue(state, (line + '\n').encode('utf-8'))
+
+    def _enqueue(self, state: ClientState, data: bytes) -> None:
+        """
+        출력 데이터를 보낸다.
+        - 밀린 출력이 없으면 바로 send 한 번으로 끝낸다(대부분의 경우).
+        - 다 못 보낸 나머지만 버퍼에 붙이고 쓰기 감시를 켠다.
+        """
+        if state.closing or state.sock not in self.clients:
+            return
+        if state.send_buf:
+            # 읽지 않는 클라이언트 때문에 출력이 한없이 쌓이면 끊는다.
+            if len(state.send_buf) + len(data) > MAX_PENDING_BYTES:
+                self._remove_client(state)
+                return
+            state.send_buf += data
+            return
 
-    @staticmethod
-    def _send_line(sock: socket.socket, line: str) -> None:
         try:
-            data = (line + '\n').encode('utf-8')
-            sock.sendall(data)
+            sent = state.sock.send(data)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
         except OSError:
-            pass
+            # 끊어진 소켓은 다음 EVENT_READ에서 정리된다.
+            return
+        if sent == len(data):
+            return
+
+        state.send_buf += memoryview(data)[sent:]
+        self.selector.modify(
+            state.sock,
+            selectors.EVENT_READ | selectors.EVENT_WRITE,
+            data=state,
+        )
 
     def _shutdown(self) -> None:
         """모든 클라이언트에 종료 안내 → 소켓 정리 → 서버 소켓 닫기."""
         self.stop_event.set()
-        with self.lock:
-            targets = list(self.clients.keys())
-        for sock in targets:
+        data = '서버가 종료됩니다.\n'.encode('utf-8')
+        for state in list(self.clients.values()):
+            try:
+                # 마지막 안내는 짧게 기다려서라도 보낸다.
+                state.sock.settimeout(1.0)
+                state.sock.sendall(bytes(state.send_buf) + data)
+            except OSError:
+                pass
             try:
-                self._send_line(sock, '서버가 종료됩니다.')
-                sock.close()
+                state.sock.close()
             except OSError:
                 pass
+        self.clients.clear()
+        self.nick_map.clear()
+        try:
+            self.selector.close()
+        except OSError:
+            pass
         try:
             self.server_sock.close()
         except OSError:
             pass
 
 
+def setup_logging() -> QueueListener:
+    """
+    로그는 큐에 넣기만 하고, 실제 출력은 리스너 스레드가 담당한다.
+    이벤트 루프가 콘솔 출력(flush)을 기다리느라 멈추지 않게 하기 위함.
+    """
+    log_q = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_q))
+    root.setLevel(logging.INFO)
+
+    listener = QueueListener(log_q, console)
+    listener.start()
+    return listener
+
+
 def admin_console(server: ChatServer) -> None:
     """서버 콘솔에서 '/종료' 입력으로 안전 종료."""
     while True:
@@ -200,17 +333,23 @@ def admin_console(server: ChatServer) -> None:
         except EOFError:
             break
         if cmd.strip() == '/종료':
-            print('[*] 서버 종료 명령 수신')
-            server._shutdown()
+            logger.info('[*] 서버 종료 명령 수신')
+            # 실제 정리는 이벤트 루프가 다음 select 후에 수행한다.
+            server.stop_event.set()
             break
 
 
 def main() -> None:
+    listener = setup_logging()
     server = ChatServer(host='0.0.0.0', port=5000)
     # 관리 콘솔 스레드 시작
     threading.Thread(target=admin_console, args=(server,), daemon=True).start()
     # 서버 루프 시작
-    server.start()
+    try:
+        server.start()
+    finally:
+        # 큐에 남은 로그까지 출력한 뒤 종료
+        listener.stop()
 
 
 if __name__ == '__main__':
@@ -1,17 +1,42 @@
 # database.py
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 SQLALCHEMY_DATABASE_URL = 'sqlite:///./app.db'
 
 # SQLite + FastAPI에서 권장되는 설정
+# - timeout: 다른 연결이 쓰는 중이면 바로 에러 내지 않고 최대 30초 기다림
+# - pool_size: WAL에서는 읽기가 동시에 돌 수 있으므로 기본(5)보다 넉넉하게
+#   (StaticPool은 연결 하나를 모든 요청이 공유해 트랜잭션이 섞이므로 쓰지 않는다)
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={'check_same_thread': False},
+    connect_args={'check_same_thread': False, 'timeout': 30},
+    pool_size=16,
 )
 
+# 연결마다 적용할 SQLite 설정
+# - WAL: 쓰기 중에도 읽기가 막히지 않고, 커밋마다 저널을 두 번 쓰지 않는다.
+# - synchronous=NORMAL: fsync는 체크포인트 때만 (WAL에서는 안전한 조합)
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+
+@event.listens_for(engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 SessionLocal = sessionmaker(
     autocommit=False,   # 과제 요구사항
     autoflush=False,
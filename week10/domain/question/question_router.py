@@ -1,5 +1,6 @@
 # domain/question/question_router.py
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -12,19 +13,27 @@ router = APIRouter(
 
 
 @router.get('/list')
-def question_list(db: Session = Depends(get_db)):
-    """질문 목록을 반환하는 API."""
-    questions = db.query(Question).order_by(Question.id.desc()).all()
+def question_list(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: int | None = None,
+    db: Session = Depends(get_db),
+):
+    """
+    질문 목록을 반환하는 API.
+    - 최신순으로 limit개씩 돌려주고, 다음 페이지는 next_cursor를 cursor로 넘겨 조회
+    """
+    # ORM 객체를 만들지 않고 필요한 컬럼만 조회한다.
+    stmt = select(
+        Question.id,
+        Question.subject,
+        Question.content,
+        Question.create_date,
+    ).order_by(Question.id.desc()).limit(limit)
+    # 키셋 페이지네이션: 이전 페이지 마지막 id보다 작은 것부터 이어서 조회
+    if cursor is not None:
+        stmt = stmt.where(Question.id < cursor)
 
-    # ORM 객체를 그대로 리턴하면 직렬화가 애매하니, dict 리스트로 변환
-    result = []
-    for question in questions:
-        result.append(
-            {
-                'id': question.id,
-                'subject': question.subject,
-                'content': question.content,
-                'create_date': question.create_date,
-            }
-        )
-    return result
+    # RowMapping은 응답 직렬화기가 모르는 타입이므로 dict로 바꿔서 돌려준다.
+    items = [dict(row) for row in db.execute(stmt).mappings()]
+    next_cursor = items[-1]['id'] if len(items) == limit else None
+    return {'items': items, 'next_cursor': next_cursor}
@@ -1,7 +1,6 @@
 # domain/question/router.py
-from typing import List
-
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -13,18 +12,27 @@ router = APIRouter(
 )
 
 
-@router.get('/', response_model=List[dict])
-def read_questions(db: Session = Depends(get_db)) -> List[dict]:
-    questions = db.query(Question).order_by(Question.id.desc()).all()
-    return [
-        {
-            'id': q.id,
-            'subject': q.subject,
-            'content': q.content,
-            'create_date': q.create_date,
-        }
-        for q in questions
-    ]
+@router.get('/', response_model=dict)
+def read_questions(
+    limit: int = Query(50, ge=1, le=100),
+    cursor: int | None = None,
+    db: Session = Depends(get_db),
+) -> dict:
+    # 읽기 전용 목록이므로 ORM 객체 대신 필요한 컬럼만 조회한다.
+    stmt = select(
+        Question.id,
+        Question.subject,
+        Question.content,
+        Question.create_date,
+    ).order_by(Question.id.desc()).limit(limit)
+    # 키셋 페이지네이션: 이전 페이지 마지막 id보다 작은 것부터 이어서 조회
+    if cursor is not None:
+        stmt = stmt.where(Question.id < cursor)
+
+    # RowMapping은 응답 직렬화기가 모르는 타입이므로 dict로 바꿔서 돌려준다.
+    items = [dict(row) for row in db.execute(stmt).mappings()]
+    next_cursor = items[-1]['id'] if len(items) == limit else None
+    return {'items': items, 'next_cursor': next_cursor}
 
 
 @router.post('/', response_model=dict)
@@ -1,15 +1,43 @@
 # database.py
+import queue
 import sqlite3
 from contextlib import contextmanager
 from typing import Iterator
 
 DB_PATH = 'question.db'
 
+# 재사용할 연결을 최대 몇 개까지 보관할지
+POOL_SIZE = 16
+# 최근에 쓴 연결(페이지 캐시가 따뜻한 연결)부터 다시 쓰도록 LIFO
+_pool: 'queue.LifoQueue[sqlite3.Connection]' = queue.LifoQueue(maxsize=POOL_SIZE)
+
+# journal_mode=WAL은 DB 파일에 기록되므로 프로세스당 한 번만 설정하면 된다.
+_wal_enabled = False
+
+# 나머지는 연결 단위 설정이라 연결을 열 때마다 적용한다.
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    '''WAL 모드와 연결별 성능 설정을 적용한다.'''
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute('PRAGMA journal_mode=WAL')
+        _wal_enabled = True
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
 
 def init_db() -> None:
     '''애플리케이션 시작 시 한 번만 호출해서 테이블 생성.'''
     conn = sqlite3.connect(DB_PATH)
     try:
+        _apply_pragmas(conn)
         cursor = conn.cursor()
         cursor.execute(
             '''
@@ -25,6 +53,14 @@ def init_db() -> None:
         conn.close()
 
 
+def _mkconn() -> sqlite3.Connection:
+    '''풀에 넣을 연결을 만든다. PRAGMA는 연결을 만들 때 한 번만 실행된다.'''
+    # FastAPI는 요청마다 다른 스레드에서 실행될 수 있으므로 스레드 검사를 끈다.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    _apply_pragmas(conn)
+    return conn
+
+
 @contextmanager
 def db_session() -> Iterator[sqlite3.Connection]:
     '''
@@ -32,13 +68,22 @@ def db_session() -> Iterator[sqlite3.Connection]:
 
     with db_session() as conn:
         ...
-    이런 식으로 쓰면, 블록이 끝날 때 자동으로 conn.close()가 호출된다.
+    이런 식으로 쓰면, 블록이 끝날 때 연결이 닫히지 않고 풀로 돌아간다.
+    풀이 비어 있으면 새로 만들고, 풀이 가득 차 있으면 그때만 닫는다.
     '''
-    conn = sqlite3.connect(DB_PATH)
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _mkconn()
     try:
         yield conn
     finally:
-        conn.close()
+        # 커밋되지 않은 트랜잭션이 다음 요청으로 새지 않도록 정리
+        conn.rollback()
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 
 def get_db() -> Iterator[sqlite3.Connection]:
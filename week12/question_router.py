@@ -1,7 +1,8 @@
 # domain/question/question_router.py
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, status
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from database import get_db
@@ -13,6 +14,10 @@ router = APIRouter(
     tags = ['question'],
 )
 
+# 단건/일괄 등록이 같이 쓰는 INSERT 문 (한 번만 만들어 컴파일 캐시를 재사용)
+# 일괄 등록 시 돌려주는 id 순서가 입력 순서와 같도록 sort_by_parameter_order를 켠다.
+INSERT_QUESTION = insert(Question).returning(Question.id, sort_by_parameter_order=True)
+
 
 @router.get(
     '/',
@@ -36,13 +41,29 @@ def question_create(
     db: Session = Depends(get_db),
 ) -> Question:
     """질문 등록 (POST, ORM 사용)"""
-    new_question = Question(
-        title = question.title,
-        content = question.content,
-    )
+    new_id = db.scalars(INSERT_QUESTION, [question.model_dump()]).one()
+    db.commit()
+
+    return db.get(Question, new_id)
+
+
+@router.post(
+    '/bulk',
+    response_model = List[int],
+    status_code = status.HTTP_201_CREATED,
+)
+def question_bulk_create(
+    questions: List[QuestionCreate],
+    db: Session = Depends(get_db),
+) -> List[int]:
+    """질문 여러 개 일괄 등록 (INSERT 한 번 + 커밋 한 번), 생성된 id 목록 반환"""
+    if not questions:
+        return []
 
-    db.add(new_question)
+    new_ids = db.scalars(
+        INSERT_QUESTION,
+        [question.model_dump() for question in questions],
+    ).all()
     db.commit()
-    db.refresh(new_question)
 
-    return new_question
+    return list(new_ids)
@@ -4,39 +4,85 @@
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.request import urlopen
 from urllib.error import URLError
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime
-import socket
+from functools import lru_cache
+import ipaddress
 import os
 import json
+import threading
+import time
 
 
 HOST = '0.0.0.0'
 PORT = 8080
 INDEX_FILE = 'index.html'
 ENABLE_GEOLOOKUP = True  # 보너스 기능: IP → 위치 조회 (표준 라이브러리로 외부 API 호출)
+SENDFILE_THRESHOLD = 256 * 1024  # 이보다 큰 index.html은 메모리에 두지 않고 sendfile로 전송
+GEO_CACHE_TTL = 3600.0   # 위치 조회 결과 보관 시간(초)
+GEO_CACHE_MAX = 1024     # 보관할 최대 IP 수 (넘으면 가장 오래 안 쓴 것부터 제거)
 
+# IP → (조회 시각, 위치). 요청 스레드와 조회 스레드가 같이 쓰므로 락으로 보호
+_geo_cache: 'OrderedDict[str, tuple[float, str]]' = OrderedDict()
+_geo_pending: set[str] = set()
+_geo_lock = threading.Lock()
+# 외부 API 호출은 응답 경로 밖(백그라운드 스레드)에서 수행
+_geo_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='geo')
 
+# index.html 캐시: ((수정 시각 ns, 크기), 내용). 파일이 바뀌었을 때만 다시 읽는다.
+_index_cache: tuple[tuple[int, int], bytes] | None = None
+
+
+@lru_cache(maxsize=4096)
 def is_private_ip(ip: str) -> bool:
-    """사설/로컬 IP 여부."""
+    """사설/로컬 IP 여부. (같은 클라이언트는 캐시에서 바로 응답)"""
     try:
-        packed = socket.inet_aton(ip)
-        b0 = packed[0]
-        b1 = packed[1]
-        # 10.0.0.0/8, 172.16.0.0/12, 192.168.0.0/16, 127.0.0.0/8
-        return (
-            b0 == 10
-            or (b0 == 172 and 16 <= b1 <= 31)
-            or (b0 == 192 and b1 == 168)
-            or b0 == 127
-        )
-    except OSError:
-        return ip in ('::1',)  # IPv6 loopback
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    # 10/8, 172.16/12, 192.168/16, 링크 로컬 등은 is_private, 127/8·::1 은 is_loopback
+    return addr.is_private or addr.is_loopback
 
 
 def geo_lookup(ip: str) -> str:
-    """외부 API(ip-api.com)로 간단 위치 조회. 실패 시 빈 문자열."""
+    """
+    캐시된 위치를 바로 돌려준다. (요청 처리를 외부 API 때문에 막지 않음)
+    - 캐시에 없거나 만료됐으면 백그라운드 조회를 걸고, 이번에는 빈 문자열(또는 이전 값)
+    - 다음 요청부터 조회된 값이 보인다.
+    """
     if not ENABLE_GEOLOOKUP or is_private_ip(ip):
         return ''
+
+    now = time.time()
+    with _geo_lock:
+        cached = _geo_cache.get(ip)
+        if cached is not None:
+            _geo_cache.move_to_end(ip)
+            if now - cached[0] < GEO_CACHE_TTL:
+                return cached[1]
+        if ip not in _geo_pending:
+            _geo_pending.add(ip)
+            _geo_executor.submit(_refresh_geo, ip)
+    return cached[1] if cached is not None else ''
+
+
+def _refresh_geo(ip: str) -> None:
+    """백그라운드에서 위치를 조회해 캐시에 넣는다."""
+    try:
+        location = _fetch_geo(ip)
+        with _geo_lock:
+            _geo_cache[ip] = (time.time(), location)
+            _geo_cache.move_to_end(ip)
+            while len(_geo_cache) > GEO_CACHE_MAX:
+                _geo_cache.popitem(last=False)
+    finally:
+        with _geo_lock:
+            _geo_pending.discard(ip)
+
+
+def _fetch_geo(ip: str) -> str:
+    """외부 API(ip-api.com)로 간단 위치 조회. 실패 시 빈 문자열."""
     url = f'http://ip-api.com/json/{ip}?fields=status,country,regionName,city,query'
     try:
         with urlopen(url, timeout=2.0) as resp:
@@ -70,7 +116,10 @@ class SimpleHandler(BaseHTTPRequestHandler):
 
     # ---- 내부 헬퍼 ----
     def _serve_index(self) -> None:
-        if not os.path.exists(INDEX_FILE):
+        global _index_cache
+        try:
+            st = os.stat(INDEX_FILE)
+        except FileNotFoundError:
             body = (
                 '<!doctype html><meta charset="utf-8">'
                 '<h1>index.html 이 없습니다.</h1>'
@@ -78,9 +127,17 @@ class SimpleHandler(BaseHTTPRequestHandler):
             self._send_response(200, 'text/html; charset=utf-8', body)
             return
 
-        with open(INDEX_FILE, 'rb') as f:
-            body = f.read()
-        self._send_response(200, 'text/html; charset=utf-8', body)
+        if st.st_size > SENDFILE_THRESHOLD:
+            self._send_file(INDEX_FILE, 'text/html; charset=utf-8')
+            return
+
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _index_cache
+        if cached is None or cached[0] != key:
+            with open(INDEX_FILE, 'rb') as f:
+                cached = (key, f.read())
+            _index_cache = cached
+        self._send_response(200, 'text/html; charset=utf-8', cached[1])
 
     def _send_not_found(self) -> None:
         body = (
@@ -89,6 +146,17 @@ class SimpleHandler(BaseHTTPRequestHandler):
         ).encode('utf-8')
         self._send_response(404, 'text/html; charset=utf-8', body)
 
+    def _send_file(self, path: str, content_type: str) -> None:
+        """헤더를 보낸 뒤 파일 내용은 sendfile로 커널에서 바로 소켓에 복사한다."""
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(size))
+            self.end_headers()
+            # socket.sendfile은 os.sendfile이 없는 플랫폼에선 send 루프로 대체된다.
+            self.connection.sendfile(f, 0, size)
+
     def _send_response(self, code: int, content_type: str, body: bytes) -> None:
         self.send_response(code)  # 여기서 200/404 등 상태코드 헤더 전송
         self.send_header('Content-Type', content_type)
@@ -110,6 +178,7 @@ def run_server() -> None:
         print('\n[*] 종료 중...')
     finally:
         server.server_close()
+        _geo_executor.shutdown(wait=False)
         print('[*] 서버 종료')
 
 
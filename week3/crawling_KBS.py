@@ -5,19 +5,23 @@
 crawling_KBS.py
 
 - KBS(http://news.kbs.co.kr) 메인 페이지에서 '주요 헤드라인'을 수집하여 List로 출력
-- BeautifulSoup 사용 (설치: pip install beautifulsoup4)
+- lxml + cssselect 사용 (설치: pip install lxml cssselect)
+  CSS 셀렉터는 모듈 로드 시 XPath로 한 번만 컴파일해 재사용
 - requests 사용 (표준 허용)
 - PEP 8 스타일 및 과제 제약 준수
 - 문자열은 기본적으로 ' ' 사용
 - 보너스: 네이버 금융에서 KOSPI 지수 간단 수집 예시 포함
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import sys
 import time
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from cssselect import HTMLTranslator
+from lxml.etree import XPath
 
 
 KBS_NEWS_URL = 'http://news.kbs.co.kr'
@@ -26,6 +30,13 @@ USER_AGENT = (
     '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 )
 
+# 모듈 전역 세션: 같은 호스트로의 TCP/TLS 연결을 재사용(keep-alive)하고 gzip 응답을 받는다.
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': USER_AGENT,
+    'Accept-Encoding': 'gzip, deflate',
+})
+
 # 개발자 도구로 확인한 '고유 셀렉터'를 최상단에 배치하세요.
 # 아래는 안전 장치를 위해 준비한 후보 셀렉터들입니다.
 SELECTOR_CANDIDATES: List[str] = [
@@ -41,12 +52,27 @@ SELECTOR_CANDIDATES: List[str] = [
     'h3 a[href*="/news/"]',
 ]
 
+# 스크립트/스타일/noscript 안의 노드는 제외 (BeautifulSoup의 decompose 대신)
+_NOT_IN_SCRIPT = '[not(ancestor::script or ancestor::style or ancestor::noscript)]'
+
+
+def _compile_css(selector: str) -> XPath:
+    """CSS 셀렉터를 스크립트 영역을 제외하는 XPath로 컴파일한다."""
+    xpath = HTMLTranslator().css_to_xpath(selector)
+    return XPath(f'({xpath}){_NOT_IN_SCRIPT}')
+
+
+# 모듈 로드 시 한 번만 컴파일
+_SELECTORS: List[XPath] = [_compile_css(s) for s in SELECTOR_CANDIDATES]
+_ALL_LINKS = XPath(f'//a{_NOT_IN_SCRIPT}')
+_KOSPI_NOW = XPath('//*[@id="KOSPI_now"]')
+_KOSPI_ALT = XPath('//span[contains(@id, "KOSPI")]')
+
 
 def fetch_html(url: str, timeout_sec: int = 10) -> Optional[str]:
     """URL 에서 HTML 문자열을 가져온다."""
-    headers = {'User-Agent': USER_AGENT}
     try:
-        res = requests.get(url, headers=headers, timeout=timeout_sec)
+        res = _session.get(url, timeout=timeout_sec)
         res.raise_for_status()
         # 일부 사이트는 인코딩을 명시하지 않으므로, requests 추정 인코딩 사용
         res.encoding = res.apparent_encoding
@@ -63,28 +89,28 @@ def normalize_text(s: str) -> str:
 
 def parse_kbs_headlines(html: str, max_count: int = 15) -> List[str]:
     """
-    BeautifulSoup을 사용하여 KBS 메인 페이지에서 헤드라인 텍스트를 추출한다.
-    - 여러 CSS 셀렉터 후보를 순차적으로 시도
+    lxml을 사용하여 KBS 메인 페이지에서 헤드라인 텍스트를 추출한다.
+    - 미리 컴파일한 셀렉터 후보(XPath)를 순차적으로 시도
     - 처음 유효한 결과가 나오는 셀렉터를 사용
     """
-    soup = BeautifulSoup(html, 'html.parser')
-
-    # 스크립트/스타일 제거(안전)
-    for tag in soup(['script', 'style', 'noscript']):
-        tag.decompose()
+    if not html.strip():
+        return []
+    doc = lxml.html.fromstring(html)
 
     # 중복 방지를 위한 집합
     seen = set()
     headlines: List[str] = []
 
-    for selector in SELECTOR_CANDIDATES:
-        elements = soup.select(selector)
+    # 셀렉터 하나에서 이만큼 모이면 나머지 요소는 볼 필요가 없다(어차피 잘려 나감).
+    enough = max(max_count, 5)
+
+    for xpath in _SELECTORS:
+        elements = xpath(doc)
         texts = []
 
         for el in elements:
             # 링크 노드일 경우 a 태그 내부 텍스트 우선
-            text = el.get_text(strip=True)
-            text = normalize_text(text)
+            text = normalize_text(el.text_content())
             if not text:
                 continue
             # 메뉴/광고성/공백성 텍스트 등 간단 필터
@@ -95,6 +121,8 @@ def parse_kbs_headlines(html: str, max_count: int = 15) -> List[str]:
                 continue
             seen.add(text)
             texts.append(text)
+            if len(texts) >= enough:
+                break
 
         # 이 셀렉터에서 유의미한 텍스트를 수집했다면, 그것만 사용하고 종료
         if len(texts) >= 5:  # 최소 5개 이상이면 헤드라인 후보로 판단(가변 가능)
@@ -104,11 +132,13 @@ def parse_kbs_headlines(html: str, max_count: int = 15) -> List[str]:
     # 그래도 충분치 않으면 상위 일부만이라도 반환
     if not headlines:
         # 백업: 페이지 내 모든 a 태그에서 제목처럼 보이는 텍스트 수집
-        for a in soup.find_all('a'):
-            text = normalize_text(a.get_text(strip=True))
+        for a in _ALL_LINKS(doc):
+            text = normalize_text(a.text_content())
             if len(text) >= 5 and text not in seen:
                 seen.add(text)
                 headlines.append(text)
+                if len(headlines) >= max_count:
+                    break
 
     # 최종 개수 제한
     return headlines[:max_count]
@@ -134,17 +164,19 @@ def fetch_kospi_index() -> Optional[str]:
     html = fetch_html(NAVER_SISE_URL)
     if html is None:
         return None
-    soup = BeautifulSoup(html, 'html.parser')
+    if not html.strip():
+        return None
+    doc = lxml.html.fromstring(html)
 
     # 네이버 금융의 KOSPI 지수 영역 id는 통상 'KOSPI_now'
-    node = soup.select_one('#KOSPI_now')
-    if node and node.get_text(strip=True):
-        return normalize_text(node.get_text(strip=True))
+    nodes = _KOSPI_NOW(doc)
+    if nodes and nodes[0].text_content().strip():
+        return normalize_text(nodes[0].text_content())
 
     # 백업: 대체 위치 탐색(사이트 개편 대비)
-    alt = soup.find('span', id=lambda v: isinstance(v, str) and 'KOSPI' in v)
+    alt = _KOSPI_ALT(doc)
     if alt:
-        return normalize_text(alt.get_text(strip=True))
+        return normalize_text(alt[0].text_content())
 
     return None
 
@@ -152,7 +184,14 @@ def fetch_kospi_index() -> Optional[str]:
 def main() -> None:
     """엔트리 포인트."""
     start = time.time()
-    html = fetch_html(KBS_NEWS_URL)
+
+    # KBS 페이지와 보너스(KOSPI)를 동시에 요청 → 전체 시간은 둘 중 느린 쪽 만큼
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        kbs_future = executor.submit(fetch_html, KBS_NEWS_URL)
+        kospi_future = executor.submit(fetch_kospi_index)
+        html = kbs_future.result()
+        kospi = kospi_future.result()
+
     if html is None:
         print('[ERROR] KBS 페이지를 불러오지 못했습니다.')
         sys.exit(1)
@@ -161,7 +200,6 @@ def main() -> None:
     print_headlines(headlines)
 
     # 보너스: KOSPI 지수 한 줄 출력
-    kospi = fetch_kospi_index()
     if kospi:
         print('\n=== 보너스: 현재 KOSPI 지수(네이버 금융) ===')
         print(f'KOSPI: {kospi}')
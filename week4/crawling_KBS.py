@@ -11,11 +11,45 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+# 텍스트 수집에 필요 없는 리소스(이미지/영상/폰트)는 CDP로 요청 자체를 막는다.
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+    '*.mp4', '*.webm', '*.woff', '*.woff2',
+]
+
+# 여러 셀렉터의 텍스트를 브라우저 안에서 한 번에 모으는 스크립트.
+# 요소마다 .text를 부르면 WebDriver 왕복이 요소 수만큼 생기므로 한 번의 호출로 끝낸다.
+# arguments: [셀렉터 목록, 최대 개수, title 속성 대체 사용 여부]
+_COLLECT_TEXTS_JS = '''
+const sels = arguments[0], limit = arguments[1], useTitle = arguments[2];
+const out = [];
+const seen = new Set();
+for (const s of sels) {
+    for (const e of document.querySelectorAll(s)) {
+        let t = (e.innerText || '').trim();
+        if (!t && useTitle) {
+            t = (e.getAttribute('title') || '').trim();
+        }
+        if (t && !seen.has(t)) {
+            seen.add(t);
+            out.push(t);
+            if (out.length >= limit) {
+                return out;
+            }
+        }
+    }
+}
+return out;
+'''
+
+
 def setup_driver(chromedriver_path: Optional[str] = None, headless: bool = False) -> webdriver.Chrome:
     """크롬 드라이버를 초기화한다."""
     opts = Options()
     opts.add_argument('--lang=ko-KR')
     opts.add_argument('--window-size=1280,900')
+    # DOMContentLoaded까지만 기다린다(이미지·광고 로딩 완료를 기다리지 않음). 이후는 wait_for로 대기
+    opts.set_capability('pageLoadStrategy', 'eager')
     if headless:
         opts.add_argument('--headless=new')
         opts.add_argument('--disable-gpu')
@@ -24,17 +58,40 @@ def setup_driver(chromedriver_path: Optional[str] = None, headless: bool = False
     else:
         # PATH에 등록되어 있거나 Selenium이 자동탐색 가능한 경우
         driver = webdriver.Chrome(options=opts)
-    driver.implicitly_wait(2)
+    # implicitly_wait는 쓰지 않는다: 명시적 대기(wait_for)와 섞이면 대기 시간이 예측 불가해진다.
+    driver.execute_cdp_cmd('Network.enable', {})
+    set_resource_blocking(driver, True)
     return driver
 
 
+def set_resource_blocking(driver: webdriver.Chrome, enabled: bool) -> None:
+    """이미지/영상/폰트 요청 차단을 켜거나 끈다."""
+    urls = BLOCKED_URL_PATTERNS if enabled else []
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': urls})
+
+
 def wait_for(driver: webdriver.Chrome, by: By, value: str, timeout: int = 10):
     """지정 요소가 나타날 때까지 대기한다."""
     return WebDriverWait(driver, timeout).until(EC.presence_of_element_located((by, value)))
 
 
+def collect_texts(driver: webdriver.Chrome, selectors: List[str], limit: int,
+                  title_fallback: bool = False) -> List[str]:
+    """셀렉터 순서대로 중복 없이 텍스트를 최대 limit개 모은다(execute_script 1회)."""
+    return driver.execute_script(_COLLECT_TEXTS_JS, selectors, limit, title_fallback) or []
+
+
 def login_naver(driver: webdriver.Chrome, user_id: str, user_pw: str) -> bool:
     """네이버에 로그인한다. 보안단계가 있으면 사용자 수동 입력을 허용한다."""
+    # 보안문자(캡차) 이미지가 보여야 하므로 로그인 중에는 리소스 차단을 잠시 끈다.
+    set_resource_blocking(driver, False)
+    try:
+        return _login_naver(driver, user_id, user_pw)
+    finally:
+        set_resource_blocking(driver, True)
+
+
+def _login_naver(driver: webdriver.Chrome, user_id: str, user_pw: str) -> bool:
     driver.get('https://nid.naver.com/nidlogin.login')
     try:
         # 기본 입력창 대기
@@ -88,11 +145,6 @@ def collect_mainpage_titles(driver: webdriver.Chrome, limit: int = 10) -> List[s
     네이버 메인에서 노출되는 주요 타이틀 일부를 모은다.
     로그인 전/후 비교용으로 같은 함수로 수집해 리스트를 반환한다.
     """
-    driver.get('https://www.naver.com/')
-    time.sleep(2)
-
-    candidates: List[str] = []
-
     # 뉴스/연예/스포츠 박스 등 다양한 블록에서 a 텍스트를 가져온다.
     # 메인 구조가 자주 바뀌므로 다중 셀렉터로 보수적으로 수집 후 정제한다.
     selectors = [
@@ -105,19 +157,14 @@ def collect_mainpage_titles(driver: webdriver.Chrome, limit: int = 10) -> List[s
         'strong.title, span.title, em.title',        # 제목 태그들
     ]
 
-    seen = set()
-    for css in selectors:
-        for a in driver.find_elements(By.CSS_SELECTOR, css):
-            txt = (a.text or '').strip()
-            if txt and txt not in seen:
-                seen.add(txt)
-                candidates.append(txt)
-            if len(candidates) >= limit:
-                break
-        if len(candidates) >= limit:
-            break
+    driver.get('https://www.naver.com/')
+    # 고정 sleep 대신, 후보 셀렉터 중 하나라도 나타나는 즉시 진행
+    try:
+        wait_for(driver, By.CSS_SELECTOR, ', '.join(selectors), timeout=10)
+    except TimeoutException:
+        pass
 
-    return candidates
+    return collect_texts(driver, selectors, limit)
 
 
 def collect_mail_subjects(driver: webdriver.Chrome, limit: int = 30) -> List[str]:
@@ -125,11 +172,6 @@ def collect_mail_subjects(driver: webdriver.Chrome, limit: int = 30) -> List[str
     로그인 사용자만 접근 가능한 네이버 메일함에서 최근 메일 제목을 수집한다.
     메일 UI가 자주 바뀌므로 여러 후보 셀렉터를 시도한다.
     """
-    driver.get('https://mail.naver.com/')
-    # 메일 리스트 로딩 대기(iframe/SPA 대비해서 넉넉히)
-    time.sleep(4)
-
-    subjects: List[str] = []
     tried_selectors = [
         'strong.mail_title',                             # 구형/일부 레이아웃
         'span.mail_title',                               # 변형
@@ -139,22 +181,15 @@ def collect_mail_subjects(driver: webdriver.Chrome, limit: int = 30) -> List[str
         '[role="row"] [role="gridcell"] a',              # ARIA 그리드 구조
     ]
 
-    seen = set()
-    for css in tried_selectors:
-        for el in driver.find_elements(By.CSS_SELECTOR, css):
-            text = (el.text or '').strip()
-            if not text:
-                # 일부는 title 속성에 제목이 담김
-                text = (el.get_attribute('title') or '').strip()
-            if text and text not in seen:
-                seen.add(text)
-                subjects.append(text)
-            if len(subjects) >= limit:
-                break
-        if len(subjects) >= limit:
-            break
+    driver.get('https://mail.naver.com/')
+    # 메일 리스트 로딩 대기: 제목 후보가 하나라도 보이면 바로 진행(SPA 대비 최대 10초)
+    try:
+        wait_for(driver, By.CSS_SELECTOR, ', '.join(tried_selectors), timeout=10)
+    except TimeoutException:
+        pass
 
-    return subjects
+    # 일부는 title 속성에 제목이 담기므로 title 대체를 켠다.
+    return collect_texts(driver, tried_selectors, limit, title_fallback=True)
 
 
 def print_list(title: str, items: List[str]) -> None:
@@ -7,8 +7,11 @@ sendmail.py
 """
 
 import argparse
+import functools
 import getpass
+import logging
 import mimetypes
+import mmap
 import os
 import socket
 import ssl
@@ -31,6 +34,14 @@ GMAIL_SMTP_HOST = 'smtp.gmail.com'
 DEFAULT_SSL_PORT = 465
 DEFAULT_STARTTLS_PORT = 587
 
+logger = logging.getLogger(__name__)
+
+# CA 번들 로딩은 한 번만: SSL/STARTTLS 전송이 같은 TLS 컨텍스트를 공유한다.
+_TLS_CTX = ssl.create_default_context()
+
+# MIME 타입 DB는 첫 조회 때 지연 로딩되므로 시작할 때 미리 읽어 둔다.
+mimetypes.init()
+
 
 def build_message(sender: str, to: list, subject: str, body: str) -> EmailMessage:
     """
@@ -44,39 +55,47 @@ def build_message(sender: str, to: list, subject: str, body: str) -> EmailMessag
     return msg
 
 
+@functools.lru_cache(maxsize=256)
+def _guess_ctype(suffix: str) -> tuple:
+    """확장자로 (maintype, subtype)을 추정한다. 같은 확장자는 캐시에서 바로 응답."""
+    ctype, encoding = mimetypes.guess_type('file' + suffix)
+    if ctype is None or encoding is not None:
+        ctype = 'application/octet-stream'
+    maintype, subtype = ctype.split('/', 1)
+    return maintype, subtype
+
+
 def attach_files(msg: EmailMessage, file_paths: list) -> None:
     """
     첨부파일 경로 리스트를 받아 메시지에 첨부한다.
     존재하지 않는 파일은 건너뛰되, 사용자에게 경고를 출력한다.
     """
+    # 반복문 안에서 쓰는 전역 이름을 지역 변수로 묶어 둔다. (LOAD_GLOBAL → LOAD_FAST)
+    path_cls, guess_ctype, fstat = Path, _guess_ctype, os.fstat
+    stderr = sys.stderr
     for fp in file_paths:
-        path = Path(fp).expanduser()
+        path = path_cls(fp).expanduser()
         if not path.is_file():
-            print(f'[경고] 첨부 불가(파일 없음): {path}', file=sys.stderr)
+            print(f'[경고] 첨부 불가(파일 없음): {path}', file=stderr)
             continue
 
-        ctype, encoding = mimetypes.guess_type(path.name)
-        if ctype is None or encoding is not None:
-            ctype = 'application/octet-stream'
-
-        maintype, subtype = ctype.split('/', 1)
+        maintype, subtype = guess_ctype(path.suffix.lower())
         with path.open('rb') as f:
-            data = f.read()
-
-        msg.add_attachment(
-            data,
-            maintype=maintype,
-            subtype=subtype,
-            filename=path.name,
-        )
+            if fstat(f.fileno()).st_size == 0:
+                # 빈 파일은 mmap 할 수 없다.
+                msg.add_attachment(b'', maintype=maintype, subtype=subtype, filename=path.name)
+                continue
+            # 파일 전체를 힙에 복사하지 않고 커널 페이지 캐시를 바로 읽어 base64 인코딩
+            # (인코딩은 add_attachment 안에서 끝나므로 나온 뒤 mmap을 닫아도 된다)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                msg.add_attachment(view, maintype=maintype, subtype=subtype, filename=path.name)
 
 
 def send_via_ssl(host: str, port: int, user: str, password: str, msg: EmailMessage) -> None:
     """
     SSL 포트(일반적으로 465)로 직접 TLS 연결 후 전송.
     """
-    context = ssl.create_default_context()
-    with SMTP_SSL(host=host, port=port, context=context, timeout=30) as server:
+    with SMTP_SSL(host=host, port=port, context=_TLS_CTX, timeout=30) as server:
         server.login(user=user, password=password)
         server.send_message(msg)
 
@@ -87,7 +106,7 @@ def send_via_starttls(host: str, port: int, user: str, password: str, msg: Email
     """
     with SMTP(host=host, port=port, timeout=30) as server:
         server.ehlo()
-        server.starttls(context=ssl.create_default_context())
+        server.starttls(context=_TLS_CTX)
         server.ehlo()
         server.login(user=user, password=password)
         server.send_message(msg)
@@ -105,6 +124,7 @@ def safe_send(
     전송을 수행하고 발생 가능한 예외를 처리한다.
     성공 시 True, 실패 시 False를 반환한다.
     """
+    # 예외마다 메시지 두 줄을 logging 호출 한 번(= stderr write 한 번)으로 남긴다.
     try:
         if use_ssl:
             send_via_ssl(host=host, port=port, user=user, password=password, msg=msg)
@@ -114,37 +134,45 @@ def safe_send(
         return True
 
     except SMTPAuthenticationError as e:
-        print('[에러] 인증 실패: 앱 비밀번호를 사용했는지, 계정/비밀번호가 올바른지 확인하세요.', file=sys.stderr)
-        print(f'       코드={e.smtp_code}, 메시지={e.smtp_error!r}', file=sys.stderr)
+        logger.error('[에러] 인증 실패: 앱 비밀번호를 사용했는지, 계정/비밀번호가 올바른지 확인하세요.\n'
+                     '       코드=%s, 메시지=%r', e.smtp_code, e.smtp_error)
     except SMTPConnectError as e:
-        print('[에러] SMTP 서버 연결 실패', file=sys.stderr)
-        print(f'       코드={e.smtp_code}, 메시지={e.smtp_error!r}', file=sys.stderr)
+        logger.error('[에러] SMTP 서버 연결 실패\n'
+                     '       코드=%s, 메시지=%r', e.smtp_code, e.smtp_error)
     except SMTPRecipientsRefused as e:
-        print('[에러] 수신자 주소 거부', file=sys.stderr)
-        print(f'       거부 목록={e.recipients}', file=sys.stderr)
+        logger.error('[에러] 수신자 주소 거부\n'
+                     '       거부 목록=%s', e.recipients)
     except SMTPSenderRefused as e:
-        print('[에러] 발신자 주소 거부', file=sys.stderr)
-        print(f'       코드={e.smtp_code}, 메시지={e.smtp_error!r}, 발신자={e.sender}', file=sys.stderr)
+        logger.error('[에러] 발신자 주소 거부\n'
+                     '       코드=%s, 메시지=%r, 발신자=%s', e.smtp_code, e.smtp_error, e.sender)
     except SMTPDataError as e:
-        print('[에러] 데이터 전송 실패', file=sys.stderr)
-        print(f'       코드={e.smtp_code}, 메시지={e.smtp_error!r}', file=sys.stderr)
+        logger.error('[에러] 데이터 전송 실패\n'
+                     '       코드=%s, 메시지=%r', e.smtp_code, e.smtp_error)
     except SMTPServerDisconnected:
-        print('[에러] 서버 연결이 예기치 않게 종료됨', file=sys.stderr)
+        logger.error('[에러] 서버 연결이 예기치 않게 종료됨')
     except (socket.gaierror, TimeoutError):
-        print('[에러] 네트워크 오류: 호스트명, 포트, 방화벽 설정을 확인하세요.', file=sys.stderr)
+        logger.error('[에러] 네트워크 오류: 호스트명, 포트, 방화벽 설정을 확인하세요.')
     except FileNotFoundError as e:
-        print('[에러] 첨부 파일을 찾을 수 없음', file=sys.stderr)
-        print(f'       파일={e.filename}', file=sys.stderr)
+        logger.error('[에러] 첨부 파일을 찾을 수 없음\n'
+                     '       파일=%s', e.filename)
     except SMTPException as e:
-        print('[에러] 일반 SMTP 예외 발생', file=sys.stderr)
-        print(f'       상세={e}', file=sys.stderr)
+        logger.error('[에러] 일반 SMTP 예외 발생\n'
+                     '       상세=%s', e)
     except Exception as e:
-        print('[에러] 알 수 없는 예외 발생', file=sys.stderr)
-        print(f'       상세={e}', file=sys.stderr)
+        logger.error('[에러] 알 수 없는 예외 발생\n'
+                     '       상세=%s', e)
 
     return False
 
 
+def setup_logging() -> None:
+    """에러 메시지는 표준 에러로, 추가 정보 없이 메시지만 출력한다."""
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
 def parse_args(argv: list) -> argparse.Namespace:
     """
     명령행 인자를 파싱한다.
@@ -170,6 +198,7 @@ def main(argv: list) -> int:
     프로그램 진입점.
     """
     args = parse_args(argv)
+    setup_logging()
 
     sender = args.sender or os.environ.get('GMAIL_SENDER', '')
     if not sender:
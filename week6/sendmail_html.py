@@ -2,12 +2,19 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import base64
 import csv
 import getpass
 import re
 import smtplib
 import ssl
-from typing import List, Tuple, Dict
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Deque, Iterator, List, Optional, Tuple, Dict
+from email import policy
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -26,26 +33,144 @@ SMTP_PROFILES: Dict[str, Dict[str, str]] = {
     }
 }
 
+# 개별 발송 병렬도(동시에 열어 둘 SMTP 연결 수)
+DEFAULT_WORKERS = 8
+# grouped 모드에서 한 통(DATA 한 번)에 넣을 수신자 수
+DEFAULT_GROUP_SIZE = 50
+# 연결 하나로 보낼 최대 메일 수 (서버의 연결당 제한을 피하려고 넘으면 새로 연결)
+MESSAGES_PER_CONNECTION = 100
+# 일시적 오류(연결 끊김, 4xx 응답) 재시도 횟수와 첫 대기 시간(초, 매번 2배)
+SEND_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0
+
+# CA 번들 로딩은 한 번만: 모든 연결이 같은 TLS 컨텍스트를 공유한다.
+_TLS_CTX = ssl.create_default_context()
+# 서버별 마지막 TLS 세션. 재연결 시 넘겨 주면 전체 핸드셰이크 대신 세션 재개로 끝난다.
+_tls_sessions: Dict[str, ssl.SSLSession] = {}
+
+# 이메일 형식 검사용 정규식 (모듈 로드 시 한 번만 컴파일)
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\Z')
+
+# DATA 전송용: CR/LF 정규화, 줄 맨 앞 '.' 이스케이프(dot-stuffing)
+_BARE_EOL_RE = re.compile(r'(?:\r\n|\n|\r(?!\n))')
+_LEADING_DOT_RE = re.compile(br'(?m)^\.')
+
+
+class _ResumingContext:
+    """wrap_socket 때 저장된 TLS 세션을 넘겨 주는 SSLContext 래퍼(smtplib용)."""
+
+    def __init__(self, context: ssl.SSLContext) -> None:
+        self.context = context
+
+    def wrap_socket(self, sock, server_hostname=None, **kwargs) -> ssl.SSLSocket:
+        session = _tls_sessions.get(server_hostname)
+        return self.context.wrap_socket(
+            sock, server_hostname=server_hostname, session=session, **kwargs
+        )
+
+
+class ResumableSMTP(smtplib.SMTP):
+    """같은 서버로 다시 연결할 때 이전 TLS 세션을 재사용하는 SMTP."""
+
+    def starttls(self, *, context: Optional[ssl.SSLContext] = None):
+        return super().starttls(context=_ResumingContext(context or _TLS_CTX))
+
+    def login(self, user: str, password: str, *, initial_response_ok: bool = True):
+        result = super().login(user, password, initial_response_ok=initial_response_ok)
+        # TLS 1.3 세션 티켓은 핸드셰이크 뒤에 도착하므로 응답을 읽은 지금 저장
+        self._remember_session()
+        return result
+
+    def close(self) -> None:
+        self._remember_session()
+        super().close()
+
+    def _remember_session(self) -> None:
+        sock = self.sock
+        if isinstance(sock, ssl.SSLSocket) and sock.session is not None:
+            _tls_sessions[self._host] = sock.session
+
+
+class PipelinedSMTP(ResumableSMTP):
+    """
+    서버가 PIPELINING을 광고하면 MAIL/RCPT/DATA를 한 번에 보내고 응답을 몰아서 읽는 SMTP.
+    메일당 명령 왕복이 (2 + 수신자 수)번에서 1번으로 줄어든다. 미지원이면 기본 sendmail.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn('pipelining'):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+
+        if isinstance(msg, str):
+            msg = _BARE_EOL_RE.sub('\r\n', msg).encode('ascii')
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        esmtp_opts = list(mail_options)
+        if self.has_extn('size'):
+            esmtp_opts.append('size=%d' % len(msg))
+        mail_args = ''.join(' ' + opt for opt in esmtp_opts)
+        rcpt_args = ''.join(' ' + opt for opt in rcpt_options)
+
+        # 명령을 모두 보낸 뒤(하나의 TCP 쓰기 묶음) 응답을 순서대로 읽는다.
+        commands = ['mail FROM:%s%s\r\n' % (smtplib.quoteaddr(from_addr), mail_args)]
+        commands += ['rcpt TO:%s%s\r\n' % (smtplib.quoteaddr(to), rcpt_args) for to in to_addrs]
+        commands.append('data\r\n')
+        self.send(''.join(commands))
+
+        mail_code, mail_resp = self.getreply()
+        senderrs = {}
+        for to in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                senderrs[to] = (code, resp)
+        data_code, data_resp = self.getreply()
+
+        ok = mail_code == 250 and len(senderrs) < len(to_addrs)
+        if data_code == 354:
+            if not ok:
+                # 거부됐는데 서버가 DATA를 받았다면 빈 본문으로 끝내고 취소
+                self.send(b'.\r\n')
+                self.getreply()
+            else:
+                body = _LEADING_DOT_RE.sub(b'..', msg)
+                if body[-2:] != b'\r\n':
+                    body += b'\r\n'
+                self.send(body + b'.\r\n')
+                data_code, data_resp = self.getreply()
+
+        if 421 in (mail_code, data_code):
+            self.close()
+        elif not ok or data_code != 250:
+            self._rset()
+
+        if mail_code != 250:
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+        if len(senderrs) == len(to_addrs):
+            raise smtplib.SMTPRecipientsRefused(senderrs)
+        if data_code != 250:
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        return senderrs
+
 
 def is_valid_email(addr: str) -> bool:
     """아주 간단한 이메일 형식 검사 (RFC 완전 준수 아님)."""
-    pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$'
-    return bool(re.match(pattern, addr.strip()))
+    return _EMAIL_RE.match(addr.strip()) is not None
 
 
 def load_targets(csv_path: str) -> List[Tuple[str, str]]:
     """CSV에서 (이름, 이메일) 목록을 읽어 유효한 이메일만 반환한다."""
-    targets: List[Tuple[str, str]] = []
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
+    # 한 번 읽으면서 바로 중복 제거 (같은 이메일은 마지막 이름 우선, 순서는 처음 등장 기준)
+    seen: Dict[str, str] = {}
+    match_email = _EMAIL_RE.match
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
             name = (row.get('이름') or '').strip()
             email = (row.get('이메일') or '').strip()
-            if name and email and is_valid_email(email):
-                targets.append((name, email))
-    # 중복 이메일 제거 (마지막 항목 우선)
-    unique: Dict[str, str] = {e: n for (n, e) in targets}
-    return [(n, e) for e, n in unique.items()]
+            if name and email and match_email(email):
+                seen[email] = name
+    return [(n, e) for e, n in seen.items()]
 
 
 def build_message_html(sender_email: str,
@@ -92,32 +217,249 @@ def render_bulk_bodies() -> Tuple[str, str]:
     return html, text
 
 
+# 개별 발송 본문 템플릿: 수신자마다 {name}만 채워 넣는다.
+INDIVIDUAL_TEXT_TEMPLATE = (
+    '{name}님 안녕하세요.\n'
+    '아래 과제 공지 전달드립니다.\n'
+    '- 과제1: HTML 메일 발송\n'
+    '- CSV에서 수신자 읽기\n'
+    '궁금한 점은 회신 부탁드립니다.'
+)
+INDIVIDUAL_HTML_TEMPLATE = (
+    '<!doctype html>'
+    '<html><body>'
+    '<h2>{name}님 안녕하세요.</h2>'
+    '<p>아래 과제 공지를 전달드립니다.</p>'
+    '<ol>'
+    '<li><b>HTML 메일 발송</b></li>'
+    '<li>CSV에서 수신자 읽기</li>'
+    '</ol>'
+    '<p>궁금한 점은 이 메일로 회신해주세요.</p>'
+    '</body></html>'
+)
+
+
+# 개별 발송 메시지 템플릿의 자리표시자.
+# 본문 파트는 UTF-8 base64로 인코딩되므로, 본문 자리표시자는 base64 결과 문자열로 찾아 바꾼다.
+TO_MARKER = '__TO__'
+TEXT_MARKER = '__TEXT_BODY__'
+HTML_MARKER = '__HTML_BODY__'
+_TO_MARKER_B = TO_MARKER.encode('ascii')
+_TEXT_MARKER_B64 = base64.b64encode(TEXT_MARKER.encode('utf-8'))
+_HTML_MARKER_B64 = base64.b64encode(HTML_MARKER.encode('utf-8'))
+# SMTP로 바로 보낼 수 있게 CRLF 줄바꿈으로 직렬화
+_SMTP_POLICY = policy.compat32.clone(linesep='\r\n')
+
+
 def render_individual_bodies(name: str) -> Tuple[str, str]:
     """개별 수신자용(이름 개인화) 본문을 반환한다."""
     safe_name = name.replace('<', '').replace('>', '')
-    text = (
-        f'{safe_name}님 안녕하세요.\n'
-        '아래 과제 공지 전달드립니다.\n'
-        '- 과제1: HTML 메일 발송\n'
-        '- CSV에서 수신자 읽기\n'
-        '궁금한 점은 회신 부탁드립니다.'
-    )
-    html = (
-        '<!doctype html>'
-        '<html><body>'
-        f'<h2>{safe_name}님 안녕하세요.</h2>'
-        '<p>아래 과제 공지를 전달드립니다.</p>'
-        '<ol>'
-        '<li><b>HTML 메일 발송</b></li>'
-        '<li>CSV에서 수신자 읽기</li>'
-        '</ol>'
-        '<p>궁금한 점은 이 메일로 회신해주세요.</p>'
-        '</body></html>'
-    )
+    text = INDIVIDUAL_TEXT_TEMPLATE.format(name=safe_name)
+    html = INDIVIDUAL_HTML_TEMPLATE.format(name=safe_name)
     return html, text
 
 
-def send_bulk(smtp_host: string, smtp_port: int,
+def build_individual_template(sender_email: str,
+                              sender_name: str,
+                              subject: str) -> Tuple[bytes, bytes, bytes, bytes]:
+    """
+    개별 발송 메시지를 한 번만 직렬화하고 자리표시자 위치에서 잘라 둔 템플릿.
+    (받는 사람 앞, 텍스트 본문 앞, HTML 본문 앞, 나머지) 4조각을 돌려준다.
+    """
+    message = build_message_html(
+        sender_email=sender_email,
+        sender_name=sender_name,
+        to_addrs=[TO_MARKER],
+        subject=subject,
+        html_body=HTML_MARKER,
+        text_body=TEXT_MARKER
+    )
+    raw = message.as_bytes(policy=_SMTP_POLICY)
+    # 헤더(To) → 텍스트 파트 → HTML 파트 순서로 나온다.
+    head, rest = raw.split(_TO_MARKER_B, 1)
+    before_text, rest = rest.split(_TEXT_MARKER_B64, 1)
+    before_html, tail = rest.split(_HTML_MARKER_B64, 1)
+    return head, before_text, before_html, tail
+
+
+def _b64_body(body: str) -> bytes:
+    """MIME 본문과 같은 형식(76자 줄바꿈, CRLF)의 base64. 마지막 줄바꿈은 템플릿에 있다."""
+    encoded = base64.encodebytes(body.encode('utf-8'))
+    return encoded.rstrip(b'\n').replace(b'\n', b'\r\n')
+
+
+def render_individual_message(template: Tuple[bytes, bytes, bytes, bytes],
+                              name: str, email: str) -> bytes:
+    """템플릿 조각 사이에 수신자 주소와 본문을 끼워 메시지 바이트를 한 번에 만든다."""
+    head, before_text, before_html, tail = template
+    html, text = render_individual_bodies(name)
+    return b''.join((
+        head, email.encode('ascii'),
+        before_text, _b64_body(text),
+        before_html, _b64_body(html),
+        tail,
+    ))
+
+
+@contextmanager
+def smtp_session(host: str, port: int,
+                 account: str, password: str) -> Iterator[smtplib.SMTP]:
+    """STARTTLS + 로그인까지 마친 SMTP 연결을 열고, 블록이 끝나면 닫는다."""
+    with PipelinedSMTP(host, port) as server:
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+        server.login(account, password)
+        yield server
+
+
+class SmtpConnectionPool:
+    """
+    로그인까지 마친 SMTP 연결을 여러 스레드가 돌려 쓰는 풀.
+    - 연결은 필요할 때 최대 size개까지 만든다.
+    - 연결당 messages_per_connection통을 보내면 닫고 새로 만든다.
+    - 일시적 오류는 지수 백오프로 SEND_ATTEMPTS번까지 재시도한다.
+    """
+
+    def __init__(self, host: str, port: int, account: str, password: str,
+                 size: int = DEFAULT_WORKERS,
+                 messages_per_connection: int = MESSAGES_PER_CONNECTION) -> None:
+        self.host = host
+        self.port = port
+        self.account = account
+        self.password = password
+        self.size = max(1, size)
+        self.messages_per_connection = messages_per_connection
+
+        # 쉬는 연결과 연결 수(_created)는 같은 Condition으로 지킨다.
+        # 반납/폐기 모두 notify 하므로 자리가 나면 기다리던 작업이 바로 깬다.
+        self._idle: Deque[Tuple[smtplib.SMTP, int]] = deque()
+        self._cond = threading.Condition()
+        self._created = 0
+
+    def __enter__(self) -> 'SmtpConnectionPool':
+        # 첫 연결은 미리 열어 둔다: 인증 실패를 병렬 작업 시작 전에 한 번만 확인
+        conn = self._acquire()
+        self._release(conn[0], conn[1])
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        server = PipelinedSMTP(self.host, self.port)
+        try:
+            server.ehlo()
+            server.starttls()
+            server.ehlo()
+            server.login(self.account, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _acquire(self) -> Tuple[smtplib.SMTP, int]:
+        """(연결, 지금까지 보낸 수)를 꺼낸다. 여유가 있으면 새로 만든다."""
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.popleft()
+                if self._created < self.size:
+                    self._created += 1
+                    break
+                # 쉬는 연결도 없고 한도도 찼으면 반납/폐기될 때까지 기다린다.
+                self._cond.wait()
+
+        try:
+            return self._connect(), 0
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, conn: smtplib.SMTP, sent: int) -> None:
+        if sent >= self.messages_per_connection:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, sent))
+            self._cond.notify()
+
+    def _discard(self, conn: smtplib.SMTP) -> None:
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], msg: bytes) -> None:
+        """풀의 연결 하나로 메일을 보낸다. 일시적 오류는 재시도한다."""
+        for attempt in range(SEND_ATTEMPTS):
+            retry: Optional[Exception] = None
+            try:
+                conn, sent = self._acquire()
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError) as exc:
+                # 새 연결을 여는 중의 일시적 오류도 같은 백오프로 재시도한다.
+                retry = exc
+            except smtplib.SMTPException:
+                # 인증 실패 등 나머지 SMTP 오류는 재시도해도 같다.
+                # (SMTPException도 OSError의 하위 클래스라 아래보다 먼저 걸러야 한다)
+                raise
+            except OSError as exc:
+                retry = exc
+            else:
+                retry = self._send_on(conn, sent, from_addr, to_addrs, msg)
+                if retry is None:
+                    return
+
+            if attempt == SEND_ATTEMPTS - 1:
+                raise retry
+            time.sleep(RETRY_BASE_DELAY * (2 ** attempt))
+
+    def _send_on(self, conn: smtplib.SMTP, sent: int,
+                 from_addr: str, to_addrs: List[str], msg: bytes) -> Optional[Exception]:
+        """
+        꺼낸 연결로 한 번 보낸다. 성공하면 None, 재시도할 오류면 그 예외를 돌려준다.
+        재시도해도 소용없는 오류는 그대로 올린다.
+        """
+        try:
+            conn.sendmail(from_addr, to_addrs, msg)
+        except smtplib.SMTPRecipientsRefused:
+            # 주소 문제는 재시도해도 같다. 연결은 멀쩡하므로 돌려놓는다.
+            self._release(conn, sent)
+            raise
+        except smtplib.SMTPServerDisconnected as exc:
+            self._discard(conn)
+            return exc
+        except smtplib.SMTPResponseException as exc:
+            # 421이면 smtplib가 이미 연결을 닫았다. 풀에 돌려놓으면 다음 작업이 헛시도한다.
+            if exc.smtp_code == 421 or conn.sock is None:
+                self._discard(conn)
+            else:
+                self._release(conn, sent)
+            if not 400 <= exc.smtp_code < 500:
+                raise
+            return exc
+        except OSError as exc:
+            self._discard(conn)
+            return exc
+
+        self._release(conn, sent + 1)
+        return None
+
+    def close(self) -> None:
+        while True:
+            with self._cond:
+                if not self._idle:
+                    break
+                conn, _ = self._idle.popleft()
+            self._discard(conn)
+
+
+def send_bulk(smtp_host: str, smtp_port: int,
               account: str, password: str,
               sender_name: str, subject: str,
               targets: List[Tuple[str, str]]) -> None:
@@ -133,38 +475,61 @@ def send_bulk(smtp_host: string, smtp_port: int,
         text_body=text
     )
 
-    context = ssl.create_default_context()
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.ehlo()
-        server.starttls(context=context)
-        server.ehlo()
-        server.login(account, password)
+    with smtp_session(smtp_host, smtp_port, account, password) as server:
         server.sendmail(account, to_list, message.as_string())
 
 
-def send_individual(smtp_host: string, smtp_port: int,
+def send_grouped(smtp_host: str, smtp_port: int,
+                 account: str, password: str,
+                 sender_name: str, subject: str,
+                 targets: List[Tuple[str, str]],
+                 group_size: int = DEFAULT_GROUP_SIZE) -> None:
+    """
+    수신자를 group_size명씩 묶어, 묶음마다 RCPT만 여러 개 지정하고 본문은 한 번만 보낸다(BCC 방식).
+    - 개인화 없음: bulk와 같은 공통 본문을 쓴다.
+    - 받는 사람(To) 헤더에는 발신자만 보이고 다른 수신자 주소는 노출되지 않는다.
+    """
+    html, text = render_bulk_bodies()
+    message = build_message_html(
+        sender_email=account,
+        sender_name=sender_name,
+        to_addrs=[account],
+        subject=subject,
+        html_body=html,
+        text_body=text
+    )
+    # 모든 묶음이 같은 바이트를 보낸다.
+    body = message.as_bytes(policy=_SMTP_POLICY)
+    emails = [email for _, email in targets]
+    size = max(1, group_size)
+
+    with smtp_session(smtp_host, smtp_port, account, password) as server:
+        for start in range(0, len(emails), size):
+            server.sendmail(account, emails[start:start + size], body)
+
+
+def send_individual(smtp_host: str, smtp_port: int,
                     account: str, password: str,
                     sender_name: str, subject: str,
-                    targets: List[Tuple[str, str]]) -> None:
-    """수신자별로 한 통씩 개별 발송(이름 개인화)."""
-    context = ssl.create_default_context()
-    with smtplib.SMTP(smtp_host, smtp_port) as server:
-        server.ehlo()
-        server.starttls(context=context)
-        server.ehlo()
-        server.login(account, password)
+                    targets: List[Tuple[str, str]],
+                    workers: int = DEFAULT_WORKERS) -> None:
+    """
+    수신자별로 한 통씩 개별 발송(이름 개인화).
+    로그인된 연결 workers개를 풀로 돌려 쓰며 병렬로 보낸다.
+    """
+    # MIME 직렬화는 한 번만 하고, 수신자마다 자리표시자만 바꾼다.
+    template = build_individual_template(account, sender_name, subject)
 
-        for name, email in targets:
-            html, text = render_individual_bodies(name)
-            message = build_message_html(
-                sender_email=account,
-                sender_name=sender_name,
-                to_addrs=[email],
-                subject=subject,
-                html_body=html,
-                text_body=text
-            )
-            server.sendmail(account, [email], message.as_string())
+    def send_one(name: str, email: str) -> None:
+        message = render_individual_message(template, name, email)
+        pool.sendmail(account, [email], message)
+
+    with SmtpConnectionPool(smtp_host, smtp_port, account, password, size=workers) as pool:
+        with ThreadPoolExecutor(max_workers=pool.size) as executor:
+            futures = [executor.submit(send_one, name, email) for name, email in targets]
+            # 모두 끝날 때까지 기다리고, 실패가 있으면 첫 예외를 호출자에게 전달
+            for future in futures:
+                future.result()
 
 
 def parse_args() -> argparse.Namespace:
@@ -173,12 +538,17 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument('--provider', choices=SMTP_PROFILES.keys(), required=True,
                         help='smtp 프로바이더 선택: gmail | naver')
-    parser.add_argument('--mode', choices=['bulk', 'individual'], required=True,
-                        help='bulk=여러 명에게 한 번에 / individual=개별 발송')
+    parser.add_argument('--mode', choices=['bulk', 'individual', 'grouped'], required=True,
+                        help='bulk=여러 명에게 한 번에 / individual=개별 발송 / '
+                             'grouped=묶음별 숨은 참조 발송(개인화 없음)')
     parser.add_argument('--csv', required=True, help='수신자 CSV 경로 (헤더: 이름,이메일)')
     parser.add_argument('--subject', required=True, help='메일 제목')
     parser.add_argument('--from-name', required=True, help='보내는 사람 표시 이름')
     parser.add_argument('--account', help='SMTP 로그인 계정 이메일(미지정 시 provider 기준 안내)')
+    parser.add_argument('--group-size', type=int, default=DEFAULT_GROUP_SIZE,
+                        help=f'grouped 모드 묶음당 수신자 수 (기본 {DEFAULT_GROUP_SIZE})')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'individual 모드 동시 연결 수 (기본 {DEFAULT_WORKERS})')
     return parser.parse_args()
 
 
@@ -213,6 +583,18 @@ def main() -> None:
                 targets=targets
             )
             print(f'완료: {len(targets)}명에게 한 통으로 일괄 발송했습니다.')
+        elif args.mode == 'grouped':
+            send_grouped(
+                smtp_host=smtp_host,
+                smtp_port=smtp_port,
+                account=account,
+                password=password,
+                sender_name=args.from_name,
+                subject=args.subject,
+                targets=targets,
+                group_size=args.group_size
+            )
+            print(f'완료: {len(targets)}명에게 {args.group_size}명씩 묶어 발송했습니다.')
         else:
             send_individual(
                 smtp_host=smtp_host,
@@ -221,7 +603,8 @@ def main() -> None:
                 password=password,
                 sender_name=args.from_name,
                 subject=args.subject,
-                targets=targets
+                targets=targets,
+                workers=args.workers
             )
             print(f'완료: {len(targets)}명에게 개별 발송했습니다.')
     except smtplib.SMTPAuthenticationError:
@@ -1,19 +1,35 @@
 # todo.py
 from pathlib import Path
-from typing import Dict, List
+from itertools import takewhile
+from typing import Dict, Optional, TextIO
 
+import asyncio
+import contextlib
 import csv
+import io
+import os
 from fastapi import APIRouter, FastAPI, HTTPException
 
 CSV_PATH = Path('todo_list.csv')
+# 추가된 항목을 한 줄씩 바로 기록하는 저널. 스냅샷(CSV 전체 저장) 후 비운다.
+JOURNAL_PATH = Path('todo_list.journal')
+SNAPSHOT_INTERVAL_SEC = 5.0
 
 app = FastAPI(title='Simple TODO API')
 router = APIRouter()
 
-# 메모리 상의 리스트
-# 프로그램 시작 시 CSV에서 읽어서 여기 넣고,
-# 새로 추가되면 CSV에도 다시 저장한다.
-todo_list: List[Dict[str, str]] = []
+# 메모리 상의 저장소: {id: content}
+# 프로그램 시작 시 CSV(+ 저널)에서 읽어서 여기 넣고,
+# 새로 추가되면 저널에 한 줄 쓰고, 주기적으로 CSV 전체를 다시 저장한다.
+# id로 바로 찾을 수 있고, dict는 추가 순서를 유지하므로 목록 순서도 그대로다.
+_todos: Dict[int, str] = {}
+
+_journal: Optional[TextIO] = None
+_dirty = False  # 마지막 스냅샷 이후 추가된 항목이 있는지
+_snapshot_task: Optional[asyncio.Task] = None
+
+# 다음에 발급할 id. CSV를 읽을 때 한 번 계산하고, 이후에는 1씩 올리기만 한다.
+_next_id = 1
 
 
 def init_csv_file() -> None:
@@ -25,41 +41,124 @@ def init_csv_file() -> None:
 
 
 def load_todo_list() -> None:
-    """CSV에서 todo_list로 데이터를 읽어온다."""
+    """CSV에서 _todos로 데이터를 읽어온다."""
+    global _next_id
     if not CSV_PATH.exists():
         init_csv_file()
         return
 
     with CSV_PATH.open('r', newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
-        todo_list.clear()
+        _todos.clear()
         for row in reader:
-            # CSV에 저장된 건 전부 문자열이므로 그대로 둔다.
-            todo_list.append({'id': row['id'], 'content': row['content']})
+            _todos[int(row['id'])] = row['content']
+    _next_id = max(_todos, default=0) + 1
 
 
-def save_todo_list() -> None:
-    """현재 메모리의 todo_list를 CSV로 다시 저장한다."""
-    with CSV_PATH.open('w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=['id', 'content'])
-        writer.writeheader()
-        for item in todo_list:
-            writer.writerow(item)
-
+def save_todo_list(items: Dict[int, str]) -> None:
+    """
+    items를 CSV로 다시 저장한다.
+    임시 파일에 쓰고 fsync 후 교체하므로 저장 도중 죽어도 기존 CSV는 깨지지 않는다.
+    """
+    # 본문 전체를 메모리에서 만든 뒤 write 한 번으로 쓴다.
+    # 따옴표/쉼표/줄바꿈 처리는 csv 모듈(C 구현)에 맡긴다.
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(['id', 'content'])
+    writer.writerows(items.items())
+
+    tmp_path = CSV_PATH.with_suffix('.csv.tmp')
+    with tmp_path.open('w', newline='', encoding='utf-8') as csvfile:
+        csvfile.write(buf.getvalue())
+        csvfile.flush()
+        os.fsync(csvfile.fileno())
+    os.replace(tmp_path, CSV_PATH)
+
+
+def replay_journal() -> None:
+    """마지막 스냅샷 이후 저널에 남은 항목을 _todos에 다시 반영한다."""
+    global _next_id, _dirty
+    if not JOURNAL_PATH.exists():
+        return
 
-def get_next_id() -> str:
-    """다음 사용할 id를 문자열로 돌려준다."""
-    if not todo_list:
-        return '1'
-    # 마지막 id + 1
-    last_id = max(int(item['id']) for item in todo_list)
-    return str(last_id + 1)
+    with JOURNAL_PATH.open('r', newline='', encoding='utf-8') as journal:
+        for row in csv.reader(journal):
+            if len(row) != 2:
+                continue
+            todo_id = int(row[0])
+            # 스냅샷 직후 저널을 비우기 전에 죽었다면 이미 CSV에 있는 항목일 수 있다.
+            if todo_id in _todos:
+                continue
+            _todos[todo_id] = row[1]
+            _next_id = max(_next_id, todo_id + 1)
+            _dirty = True
+
+
+def open_journal() -> None:
+    global _journal
+    _journal = JOURNAL_PATH.open('a', newline='', encoding='utf-8')
+
+
+def append_journal(todo_id: int, content: str) -> None:
+    """항목 하나를 저널 끝에 기록한다. (열어 둔 파일에 write 한 번)"""
+    global _dirty
+    csv.writer(_journal).writerow([todo_id, content])
+    _journal.flush()
+    _dirty = True
+
+
+async def snapshot_todo_list() -> None:
+    """_todos 전체를 CSV에 저장하고, 저장된 만큼 저널을 비운다."""
+    global _dirty
+    items = dict(_todos)
+    cutoff = _next_id
+    _dirty = False
+    saving = asyncio.ensure_future(asyncio.to_thread(save_todo_list, items))
+    try:
+        await asyncio.shield(saving)
+    except asyncio.CancelledError:
+        # 작업이 취소돼도 저장 스레드는 계속 돈다. 끝날 때까지 기다려야
+        # 이어지는 저장이 같은 임시 파일을 동시에 쓰지 않는다.
+        await asyncio.wait([saving])
+        _dirty = True
+        raise
+    except OSError:
+        _dirty = True
+        raise
+
+    # 저장하는 동안 새로 들어온 항목(id >= cutoff)만 저널에 남긴다.
+    # id는 증가 순으로 추가되므로 뒤에서부터 보면 새 항목만 훑고 끝난다.
+    pending = list(takewhile(lambda kv: kv[0] >= cutoff, reversed(_todos.items())))
+    _journal.seek(0)
+    _journal.truncate()
+    csv.writer(_journal).writerows(reversed(pending))
+    _journal.flush()
+
+
+async def snapshotter() -> None:
+    """SNAPSHOT_INTERVAL_SEC마다 변경이 있으면 스냅샷을 만든다."""
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL_SEC)
+        if _dirty:
+            try:
+                await snapshot_todo_list()
+            except OSError as exc:
+                print(f'[경고] 스냅샷 저장 실패: {exc}')
+
+
+def get_next_id() -> int:
+    """다음 사용할 id를 돌려주고 카운터를 올린다."""
+    # 이벤트 루프 스레드에서만 호출되고 중간에 await가 없으므로 락이 필요 없다.
+    global _next_id
+    new_id = _next_id
+    _next_id += 1
+    return new_id
 
 
 @router.post('/todo')
 async def add_todo(payload: Dict) -> Dict:
     """
-    todo_list에 새로운 항목을 추가한다.
+    _todos에 새로운 항목을 추가한다.
     - POST 방식
     - 입력/출력은 Dict
     - 보너스: 빈 dict가 들어오면 경고
@@ -74,31 +173,61 @@ async def add_todo(payload: Dict) -> Dict:
     if not content:
         raise HTTPException(status_code=400, detail='content 필드는 필수입니다.')
 
-    new_item = {
-        'id': get_next_id(),
-        'content': content,
+    todo_id = get_next_id()
+    _todos[todo_id] = content
+    # CSV 전체 대신 저널에 한 줄만 기록 (CSV는 snapshotter가 주기적으로 갱신)
+    append_journal(todo_id, content)
+    return {
+        'message': 'todo가 추가되었습니다.',
+        'data': {'id': str(todo_id), 'content': content},
     }
-    todo_list.append(new_item)
-    save_todo_list()
-    return {'message': 'todo가 추가되었습니다.', 'data': new_item}
 
 
 @router.get('/todo')
 async def retrieve_todo() -> Dict:
     """
-    todo_list 전체를 Dict로 돌려준다.
+    _todos 전체를 Dict로 돌려준다.
     - GET 방식
     - 출력은 Dict
     """
-    return {'count': len(todo_list), 'data': todo_list}
+    return {
+        'count': len(_todos),
+        'data': [{'id': str(k), 'content': v} for k, v in _todos.items()],
+    }
 
 
 # 라우터를 앱에 등록
 app.include_router(router)
 
 
-# 앱 시작 시 CSV 로드
+# 앱 시작 시 CSV 로드 → 저널 재생 → 스냅샷 작업 시작
 @app.on_event('startup')
 async def startup_event() -> None:
+    global _snapshot_task
     init_csv_file()
     load_todo_list()
+    replay_journal()
+    open_journal()
+    _snapshot_task = asyncio.create_task(snapshotter())
+
+
+# 앱 종료 시 남은 변경을 CSV에 저장
+@app.on_event('shutdown')
+async def shutdown_event() -> None:
+    if _snapshot_task is not None:
+        _snapshot_task.cancel()
+        # 진행 중인 스냅샷이 있으면 끝날 때까지 기다린 뒤 마지막 저장을 한다.
+        with contextlib.suppress(asyncio.CancelledError):
+            await _snapshot_task
+    if _dirty:
+        await snapshot_todo_list()
+    _journal.close()
+
+
+# 직접 실행: python todo.py
+# uvicorn의 loop/http 'auto'는 uvloop, httptools가 설치돼 있으면 그것을 쓰고
+# 없으면 asyncio/h11로 돌아간다. (uvicorn todo:app --loop uvloop --http httptools 와 같음)
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run(app, host='127.0.0.1', port=8000, loop='auto', http='auto')